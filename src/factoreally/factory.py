@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache
+from types import CodeType, FunctionType
 from typing import TYPE_CHECKING, Any
 
 from factoreally.factory_spec import FactorySpec, load_factory_spec
@@ -19,6 +22,120 @@ KeywordCallable = Callable[..., Any]  # For keyword-only variants
 OverrideValue = Any | NoArgsCallable | ValueCallable | ValueObjectCallable | KeywordCallable
 
 
+def _classify_override(callable_override: Callable[..., Any]) -> tuple[int, tuple[str, ...]]:
+    """Get the positional parameter count and keyword-only parameter names of a callable override.
+
+    Plain functions and lambdas are read directly from their code object, which is cached
+    so that closures recreated for every build share one result. Anything else (or anything
+    wrapped) goes through inspect.signature, uncached, since it may not be hashable.
+
+    Args:
+        callable_override: The callable to classify
+
+    Returns:
+        Tuple of (positional_count, keyword_only_names)
+    """
+    if (
+        isinstance(callable_override, FunctionType)
+        and not hasattr(callable_override, "__wrapped__")
+        and not hasattr(callable_override, "__signature__")
+    ):
+        return _classify_code(callable_override.__code__)
+
+    params = inspect.signature(callable_override).parameters.values()
+
+    # Count positional parameters (exclude keyword-only)
+    positional_count = sum(1 for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
+    keyword_only_names = tuple(p.name for p in params if p.kind == p.KEYWORD_ONLY)
+    return positional_count, keyword_only_names
+
+
+@lru_cache(maxsize=4096)
+def _classify_code(code: CodeType) -> tuple[int, tuple[str, ...]]:
+    """Get the positional parameter count and keyword-only parameter names from a function's code object."""
+    keyword_only_names = code.co_varnames[code.co_argcount : code.co_argcount + code.co_kwonlyargcount]
+    return code.co_argcount, keyword_only_names
+
+
+@cache
+def _override_key_to_field_path(key: str) -> str:
+    """Convert a double-underscore override key to a dot notation field path with array support.
+
+    Results are cached because the same override keys are typically passed on every build.
+
+    Args:
+        key: Override key that may contain double underscores, e.g. "data__0__name"
+
+    Returns:
+        Field path like "data[0].name"
+    """
+    # Convert double underscores to dots for nested field paths
+    field_path = key.replace("__", ".")
+
+    # Handle numeric array indexes: convert "data.0.name" to "data[0].name"
+    parts = field_path.split(".")
+    processed_parts: list[str] = []
+    for part in parts:
+        if part.isdigit():
+            # This is a numeric index, format as array index
+            if processed_parts:
+                processed_parts[-1] = f"{processed_parts[-1]}[{part}]"
+            else:
+                # Edge case: starts with a number (shouldn't happen normally)
+                processed_parts.append(f"[{part}]")
+        else:
+            processed_parts.append(part)
+
+    return ".".join(processed_parts)
+
+
+@cache
+def _parse_field_path(field_path: str) -> tuple[str | int, ...]:
+    """Parse field path into parts, handling array indices.
+
+    Results are cached because the same override paths are applied on every build.
+    Field names are interned to match the interned keys of built objects.
+
+    Args:
+        field_path: Field path like "data.actions[0].type"
+
+    Returns:
+        Tuple of path parts (strings and integers for array indices)
+    """
+    parts: list[str | int] = []
+    current_part = ""
+    i = 0
+    while i < len(field_path):
+        char = field_path[i]
+        if char == ".":
+            if current_part:
+                parts.append(sys.intern(current_part))
+                current_part = ""
+        elif char == "[":
+            if current_part:
+                parts.append(sys.intern(current_part))
+                current_part = ""
+            # Find the closing bracket
+            j = i + 1
+            while j < len(field_path) and field_path[j] != "]":
+                j += 1
+            if j < len(field_path):
+                index_str = field_path[i + 1 : j]
+                if index_str.isdigit():
+                    parts.append(int(index_str))
+                i = j
+            else:
+                current_part += char
+        else:
+            current_part += char
+        i += 1
+
+    if current_part:
+        parts.append(sys.intern(current_part))
+
+    return tuple(parts)
+
+
 class Factory:
     """Factory class for generating dictionary data based on factory spec."""
 
@@ -58,25 +175,7 @@ class Factory:
 
         for fields in (override or {}, overrides):
             for key, value in fields.items():
-                # Convert double underscores to dots for nested field paths
-                field_path = key.replace("__", ".")
-
-                # Handle numeric array indexes: convert "data.0.name" to "data[0].name"
-                parts = field_path.split(".")
-                processed_parts: list[str] = []
-                for part in parts:
-                    if part.isdigit():
-                        # This is a numeric index, format as array index
-                        if processed_parts:
-                            processed_parts[-1] = f"{processed_parts[-1]}[{part}]"
-                        else:
-                            # Edge case: starts with a number (shouldn't happen normally)
-                            processed_parts.append(f"[{part}]")
-                    else:
-                        processed_parts.append(part)
-
-                processed_field_path = ".".join(processed_parts)
-                processed[processed_field_path] = value
+                processed[_override_key_to_field_path(key)] = value
 
         return processed
 
@@ -110,7 +209,7 @@ class Factory:
 
         return result
 
-    def _set_nested_value_from_parts(self, data: dict[str, Any], parts: list[str | int], value: Any) -> None:  # noqa: C901,PLR0912
+    def _set_nested_value_from_parts(self, data: dict[str, Any], parts: Sequence[str | int], value: Any) -> None:  # noqa: C901,PLR0912
         """Set a nested value using pre-parsed parts list.
 
         Args:
@@ -118,6 +217,21 @@ class Factory:
             parts: List of path parts (strings and integers for array indices)
             value: Value to set
         """
+        # Walk through nested objects iteratively, leaving arrays and the final part to the logic below
+        depth = 0
+        last = len(parts) - 1
+        while depth < last and isinstance(data, dict):
+            part = parts[depth]
+            if not isinstance(part, str):
+                break
+            if part not in data:
+                # Determine what to create based on next part
+                data[part] = [] if isinstance(parts[depth + 1], int) else {}
+            data = data[part]
+            depth += 1
+        if depth:
+            parts = parts[depth:]
+
         if not parts:
             return
 
@@ -186,51 +300,9 @@ class Factory:
             return
 
         # Parse field path and use the helper method to handle the parsed parts
-        parts = self._parse_field_path(field_path)
+        parts = _parse_field_path(field_path)
         self._set_nested_value_from_parts(data, parts, value)
 
-    def _parse_field_path(self, field_path: str) -> list[str | int]:
-        """Parse field path into parts, handling array indices.
-
-        Args:
-            field_path: Field path like "data.actions[0].type"
-
-        Returns:
-            List of path parts (strings and integers for array indices)
-        """
-        parts: list[str | int] = []
-        current_part = ""
-        i = 0
-        while i < len(field_path):
-            char = field_path[i]
-            if char == ".":
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-            elif char == "[":
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                # Find the closing bracket
-                j = i + 1
-                while j < len(field_path) and field_path[j] != "]":
-                    j += 1
-                if j < len(field_path):
-                    index_str = field_path[i + 1 : j]
-                    if index_str.isdigit():
-                        parts.append(int(index_str))
-                    i = j
-                else:
-                    current_part += char
-            else:
-                current_part += char
-            i += 1
-
-        if current_part:
-            parts.append(current_part)
-
-        return parts
-
     def _get_nested_value(self, data: dict[str, Any], field_path: str) -> Any:
         """Get a nested value from a dictionary using dot notation and array indexing.
 
@@ -246,10 +318,10 @@ class Factory:
             return data.get(field_path)
 
         # Parse field path and traverse the data structure
-        parts = self._parse_field_path(field_path)
+        parts = _parse_field_path(field_path)
         return self._get_nested_value_from_parts(data, parts)
 
-    def _get_nested_value_from_parts(self, data: dict[str, Any] | list[Any] | Any, parts: list[str | int]) -> Any:
+    def _get_nested_value_from_parts(self, data: dict[str, Any] | list[Any] | Any, parts: Sequence[str | int]) -> Any:
         """Get a nested value using pre-parsed parts list.
 
         Args:
@@ -259,31 +331,14 @@ class Factory:
         Returns:
             The value at the path, or None if path doesn't exist
         """
-        if not parts:
-            return data
-
-        if len(parts) == 1:
-            # Final part - get the value
-            final_part = parts[0]
-            if isinstance(final_part, int) and isinstance(data, list) and 0 <= final_part < len(data):
-                return data[final_part]
-            if isinstance(final_part, str) and isinstance(data, dict):
-                return data.get(final_part)
-            return None
-
-        # Navigate to next level
-        current_part = parts[0]
-        remaining_parts = parts[1:]
-
-        # Determine next data level based on current part type
-        next_data = None
-        if (isinstance(current_part, int) and isinstance(data, list) and 0 <= current_part < len(data)) or (
-            isinstance(current_part, str) and isinstance(data, dict) and current_part in data
-        ):
-            next_data = data[current_part]  # type: ignore[index]
-
-        # Recursively process remaining parts if we found valid next data
-        return self._get_nested_value_from_parts(next_data, remaining_parts) if next_data is not None else None
+        for part in parts:
+            if isinstance(part, int) and isinstance(data, list) and 0 <= part < len(data):
+                data = data[part]
+            elif isinstance(part, str) and isinstance(data, dict):
+                data = data.get(part)
+            else:
+                return None
+        return data
 
     def _raise_unknown_keyword_error(self, param_name: str) -> None:
         """Raise error for unknown keyword parameter.
@@ -299,14 +354,14 @@ class Factory:
 
     def _build_keyword_args(
         self,
-        keyword_only_params: list[Any],
+        keyword_only_names: tuple[str, ...],
         field_value: Any,
         entire_object: dict[str, Any],
     ) -> dict[str, Any]:
         """Build keyword arguments for callable override.
 
         Args:
-            keyword_only_params: List of keyword-only parameters
+            keyword_only_names: Names of the keyword-only parameters
             field_value: Current value of the field being overridden
             entire_object: The entire generated object
 
@@ -317,13 +372,13 @@ class Factory:
             TypeError: If unknown keyword parameter found
         """
         kwargs = {}
-        for param in keyword_only_params:
-            if param.name == "value":
+        for name in keyword_only_names:
+            if name == "value":
                 kwargs["value"] = field_value
-            elif param.name == "obj":
+            elif name == "obj":
                 kwargs["obj"] = entire_object
             else:
-                self._raise_unknown_keyword_error(param.name)
+                self._raise_unknown_keyword_error(name)
         return kwargs
 
     def _call_with_positional_args(
@@ -349,14 +404,19 @@ class Factory:
         Raises:
             TypeError: If too many positional parameters
         """
-        if kwargs is None:
-            kwargs = {}
-
-        if positional_count == 0:
+        if not kwargs:
+            # Most overrides take only positional parameters, so avoid packing an empty kwargs dict
+            if positional_count == 0:
+                return callable_override()
+            if positional_count == 1:
+                return callable_override(field_value)
+            if positional_count == 2:  # noqa: PLR2004
+                return callable_override(field_value, entire_object)
+        elif positional_count == 0:
             return callable_override(**kwargs)
-        if positional_count == 1:
+        elif positional_count == 1:
             return callable_override(field_value, **kwargs)
-        if positional_count == 2:  # noqa: PLR2004
+        elif positional_count == 2:  # noqa: PLR2004
             return callable_override(field_value, entire_object, **kwargs)
 
         msg = f"Callable override has too many positional parameters ({positional_count}). Maximum is 2."
@@ -378,30 +438,19 @@ class Factory:
         Raises:
             TypeError: If callable has invalid signature
         """
-        sig = inspect.signature(callable_override)
-        params = list(sig.parameters.values())
-
-        # Count positional parameters (exclude keyword-only)
-        positional_count = sum(1 for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
-        keyword_only_params = [p for p in params if p.kind == p.KEYWORD_ONLY]
+        positional_count, keyword_only_names = _classify_override(callable_override)
 
         # Handle keyword-only parameters if present
-        if keyword_only_params:
-            kwargs = self._build_keyword_args(keyword_only_params, field_value, entire_object)
-            return self._call_with_positional_args(
-                callable_override,
-                positional_count,
-                field_value,
-                entire_object,
-                kwargs,
-            )
-
-        # Handle positional-only parameters
+        kwargs = None
+        if keyword_only_names:
+            kwargs = self._build_keyword_args(keyword_only_names, field_value, entire_object)
+
         return self._call_with_positional_args(
             callable_override,
             positional_count,
             field_value,
             entire_object,
+            kwargs,
         )
 
     def build(
@@ -422,8 +471,12 @@ class Factory:
         # Generate base data using FactorySpec
         data = self._factory_spec.build()
 
-        # Process and combine all overrides
-        combined_overrides = self._overrides | self._process_overrides(override, **overrides)
+        # Process and combine all overrides, reusing the factory overrides when none are passed
+        combined_overrides = (
+            self._overrides | self._process_overrides(override, **overrides)
+            if override or overrides
+            else self._overrides
+        )
 
         # Apply overrides to the generated data
         return self._apply_overrides(data, combined_overrides)
@@ -463,7 +516,11 @@ class Factory:
             msg = "Slice stop value is required"
             raise TypeError(msg)
 
-        return [self.build() for _ in range(key.start or 0, key.stop, key.step or 1)]
+        # Bind the per-record steps once rather than going through build() for every record
+        build_data = self._factory_spec.build
+        apply_overrides = self._apply_overrides
+        overrides = self._overrides
+        return [apply_overrides(build_data(), overrides) for _ in range(key.start or 0, key.stop, key.step or 1)]
 
     def __iter__(self) -> Factory:
         """Return self as iterator for infinite generation."""
@@ -1,12 +1,17 @@
 import json
 import random
 import string
+import sys
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from factoreally.hints import create_hints_from_spec_format, generate_value_from_hints
 from factoreally.hints.base import MISSING, NULL, AnalysisHint, Sentinel
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class SpecValidationError(Exception):
     """Raised when factory specification is invalid or corrupted."""
@@ -27,7 +32,8 @@ class FactorySpec:
         self._is_object_field = "OBJECT" in {h.type for h in self._hints}
         self._array_element_factory: FactorySpec | None = None
         self._object_element_factory: FactorySpec | None = None
-        self._child_factories: dict[str, FactorySpec] = {}
+        self._child_builders: list[tuple[str, Callable[[], Any]]] = []
+        self._children_always_present = False
         self._prepared = False
 
     def build(self) -> Any:
@@ -177,10 +183,23 @@ class FactorySpec:
     def _prepare_object(self) -> None:
         for field_path, field_path_hints in self._children.items():
             child_field_path = f"{self._field_path}.{field_path}" if self._field_path else field_path
-            self._child_factories[field_path] = self.__class__(
+            factory = self.__class__(
                 field_path_hints,
                 field_path=child_field_path,
             )
+            # Leaf children are built directly, skipping the dispatch in build()
+            builder = factory._build_leaf if factory._is_leaf() else factory.build  # noqa: SLF001
+            self._child_builders.append((field_path, builder))
+
+        # Without MISSING hints every child is always present, so the object can be built in one pass
+        self._children_always_present = not any(
+            hint.type == "MISSING"
+            for field_path_hints in self._children.values()
+            for hint in field_path_hints.get("", [])
+        )
+
+    def _is_leaf(self) -> bool:
+        return not (self._is_array_field or self._is_object_field or self._children)
 
     def _build_object(self) -> dict[str, Any] | None:
         """Build object with child fields."""
@@ -193,9 +212,12 @@ class FactorySpec:
                 return None
 
         # Otherwise, build the object.
+        if self._children_always_present:
+            return {field_path: builder() for field_path, builder in self._child_builders}
+
         result: dict[str, Any] = {}
-        for field_path, factory in self._child_factories.items():
-            value = factory.build()
+        for field_path, builder in self._child_builders:
+            value = builder()
             if value is not MISSING:
                 if value is NULL:
                     raise NotImplementedError(field_path, value)
@@ -211,17 +233,16 @@ class FactorySpec:
 
 
 def load_factory_spec(spec: str | Path | dict[str, Any]) -> FactorySpec:
-    if isinstance(spec, Path):
-        spec_data = json.loads(spec.read_text())
-    elif isinstance(spec, str):
-        spec_data = json.loads(Path(spec).read_text())
+    if isinstance(spec, str | Path):
+        # Read bytes so json.loads detects the UTF encoding instead of relying on the locale
+        spec_data = json.loads(Path(spec).read_bytes())
     else:
         spec_data = spec
 
     # Convert spec format to field hints format
-    field_hints: FieldHints = {}
-    for field_path, hints_data in spec_data["fields"].items():
-        field_hints[field_path] = create_hints_from_spec_format(hints_data)
+    field_hints: FieldHints = {
+        field_path: create_hints_from_spec_format(hints_data) for field_path, hints_data in spec_data["fields"].items()
+    }
 
     return FactorySpec(field_hints)
 
@@ -259,9 +280,14 @@ def _parse_field_paths(
     return current, children
 
 
+@cache
 def _parse_field_path_components(field_path: str) -> tuple[str, str]:
     """Parse a field path into child name and remainder.
 
+    Results are cached because specs loaded repeatedly, and the nested
+    specs built from them, split the same field paths again. Child names
+    are interned since they become the keys of every built object.
+
     Args:
         field_path: Field path to parse
 
@@ -276,13 +302,14 @@ def _parse_field_path_components(field_path: str) -> tuple[str, str]:
     positions = _find_delimiter_positions(field_path)
 
     if not positions:
-        return field_path, ""
+        return sys.intern(field_path), ""
 
     # Find the earliest position and split accordingly
     positions.sort(key=lambda x: x[0])
     _first_pos, first_type = positions[0]
 
-    return _split_by_delimiter_type(field_path, first_type)
+    child_name, remainder = _split_by_delimiter_type(field_path, first_type)
+    return sys.intern(child_name), remainder
 
 
 def _find_delimiter_positions(field_path: str) -> list[tuple[int, str]]:
@@ -1,6 +1,7 @@
 """Strongly typed hint classes for factory generation analysis."""
 
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 # Import individual hint classes from their own files
@@ -101,14 +102,17 @@ def generate_value_from_hints(hints: list[AnalysisHint]) -> Any:
     return chain(None)
 
 
-def _create_hint_chain(remaining_hints: list[AnalysisHint]) -> Callable[[Any], Any]:
-    if not remaining_hints:
-        # Base case: no more hints to process, return the value as-is
-        return lambda value: value
+def _identity(value: Any) -> Any:
+    return value
 
-    # Get the next hint and create a chain for the remaining hints
-    current_hint = remaining_hints[0]
-    next_chain = _create_hint_chain(remaining_hints[1:])
 
-    # Return a function that applies the current hint
-    return lambda value: current_hint.process_value(value, next_chain)
+def _create_hint_chain(hints: list[AnalysisHint]) -> Callable[[Any], Any]:
+    # Base case: no more hints to process, return the value as-is
+    chain: Callable[[Any], Any] = _identity
+
+    # Wrap from the last hint backwards so that each hint calls the rest of the chain.
+    # Using partial avoids an extra Python frame per hint and slicing the hint list.
+    for hint in reversed(hints):
+        chain = partial(hint.process_value, call_next=chain)
+
+    return chain
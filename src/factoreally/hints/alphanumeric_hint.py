@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Self
 
 from factoreally.constants import MIN_VALUES_FOR_ALPLHANUMERIC
@@ -13,14 +13,31 @@ from factoreally.hints.base import AnalysisHint
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Charset used for positions that have no charset in the hint
+DEFAULT_CHARSET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AlphanumericHint(AnalysisHint):
     """Hint for position-specific alphanumeric string generation."""
 
     type: str = "ALPHA"
     chrs: dict[str, list[int]]
 
+    # Charset for each position, derived from chrs
+    _charsets: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    # Charset used by every position, if they all share one
+    _shared_charset: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Expand chrs into a charset per position, using DEFAULT_CHARSET for positions it doesn't cover."""
+        pos_to_charset = {pos: charset for charset, positions in self.chrs.items() for pos in positions}
+        length = max(pos_to_charset, default=-1) + 1
+        charsets = tuple(pos_to_charset.get(pos, DEFAULT_CHARSET) for pos in range(length))
+        object.__setattr__(self, "_charsets", charsets)
+        object.__setattr__(self, "_shared_charset", charsets[0] if len(set(charsets)) == 1 else None)
+
     @classmethod
     def create_from_values(cls, values: list[str]) -> Self | None:
         """Create AlphanumericHint for fixed-length alphanumeric patterns."""
@@ -51,21 +68,9 @@ class AlphanumericHint(AnalysisHint):
     def process_value(self, value: Any, call_next: Callable[[Any], Any]) -> Any:
         """Process value through alphanumeric hint - generate if no input, continue chain."""
         if value is None:
-            # Build position-to-charset lookup
-            pos_to_charset: dict[int, str] = {}
-            for charset, positions in self.chrs.items():
-                for pos in positions:
-                    pos_to_charset[pos] = charset
-
-            # Generate string
-            positions_list = [pos for positions in self.chrs.values() for pos in positions]
-            if not positions_list:
-                value = ""
+            if self._shared_charset is not None:
+                # Every position uses the same charset, so pick them all in one call
+                value = "".join(random.choices(self._shared_charset, k=len(self._charsets)))
             else:
-                max_pos = max(positions_list)
-                chars = []
-                for pos in range(max_pos + 1):
-                    charset = pos_to_charset.get(pos, "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
-                    chars.append(random.choice(charset))
-                value = "".join(chars)
+                value = "".join([random.choice(charset) for charset in self._charsets])
         return call_next(value)
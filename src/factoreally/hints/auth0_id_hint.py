@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Auth0IdHint(AnalysisHint):
     """Hint for Auth0 ID pattern generation."""
 
@@ -28,6 +28,6 @@ class Auth0IdHint(AnalysisHint):
     def process_value(self, value: Any, call_next: Callable[[Any], Any]) -> Any:
         """Process value through Auth0 ID hint - generate if no input, continue chain."""
         if value is None:
-            hex_string = "".join(random.choice("0123456789abcdef") for _ in range(24))
-            value = f"auth0|{hex_string}"
+            # 12 random bytes encode to 24 hex chars in a single call
+            value = f"auth0|{random.randbytes(12).hex()}"
         return call_next(value)
@@ -20,7 +20,7 @@ NULL = Sentinel("NullValueMarker")
 MISSING = Sentinel("MissingFieldMarker")
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalysisHint(ABC):
     """Base class for all analysis hints.
 
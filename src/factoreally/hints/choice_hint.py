@@ -1,16 +1,19 @@
 """Choice hint for generating categorical values with optional weighting."""
 
+import math
 import random
+from bisect import bisect
 from collections import Counter
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import accumulate
 from typing import Any, Self
 
 from factoreally.constants import MAX_PRECISION
 from factoreally.hints.base import AnalysisHint, SimpleType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChoiceHint(AnalysisHint):
     """Hint for choice generation with optional weighting."""
 
@@ -19,12 +22,30 @@ class ChoiceHint(AnalysisHint):
     choices: list[SimpleType]
     weights: list[float] | None = None
 
+    # Cumulative weights, derived from weights (empty when choices are uniform)
+    _cum_weights: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Accumulate the weights once so that each weighted choice is a single bisect."""
+        cum_weights: tuple[float, ...] = ()
+        if self.choices and self.weights and len(self.choices) == len(self.weights):
+            cum_weights = tuple(accumulate(self.weights))
+            # Same checks (and messages) as random.choices, which this replaces
+            if cum_weights[-1] <= 0:
+                msg = "Total of weights must be greater than zero"
+                raise ValueError(msg)
+            if not math.isfinite(cum_weights[-1]):
+                msg = "Total of weights must be finite"
+                raise ValueError(msg)
+        object.__setattr__(self, "_cum_weights", cum_weights)
+
     def process_value(self, value: Any, call_next: Callable[[Any], Any]) -> Any:
         """Process value through choice hint - generate if no input, continue chain."""
         if value is None and self.choices:
-            if self.weights and len(self.choices) == len(self.weights):
+            if cum_weights := self._cum_weights:
                 # Use weighted choice when weights are provided
-                value = random.choices(self.choices, weights=self.weights)[0]
+                index = bisect(cum_weights, random.random() * cum_weights[-1], 0, len(cum_weights) - 1)
+                value = self.choices[index]
             else:
                 # Use simple uniform choice when no weights or mismatched lengths
                 value = random.choice(self.choices)
@@ -7,7 +7,7 @@ from typing import Any
 from factoreally.hints.base import AnalysisHint
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ConstantValueHint(AnalysisHint):
     """Hint for constant value generation."""
 
@@ -2,13 +2,13 @@
 
 import random
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from factoreally.hints.base import MISSING, AnalysisHint
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MissingHint(AnalysisHint):
     """Hint for field presence control."""
 
@@ -16,9 +16,18 @@ class MissingHint(AnalysisHint):
 
     pct: float
 
+    # Probability of the field being missing, derived from pct
+    _threshold: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Set _threshold from pct, e.g. 70.0 becomes 0.7."""
+        object.__setattr__(self, "_threshold", self.pct / 100)
+
     def process_value(self, value: Any, call_next: Callable[[Any], Any]) -> Any:
         """Process value through missing hint - continue chain or return MISSING."""
-        # Use pct as probability (e.g., 70.0 means 70% chance of field being missing)
-        if random.random() * 100 < self.pct:
+        # Use pct as probability (e.g., 70.0 means 70% chance of field being missing).
+        # Always/never missing fields skip the random number entirely.
+        threshold = self._threshold
+        if threshold >= 1 or (threshold > 0 and random.random() < threshold):
             return MISSING
         return call_next(value)  # Continue the hint chain
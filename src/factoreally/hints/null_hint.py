@@ -8,7 +8,7 @@ from typing import Any
 from factoreally.hints.base import NULL, AnalysisHint
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NullHint(AnalysisHint):
     """Hint for null value control."""
 
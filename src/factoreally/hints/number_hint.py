@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NamedTuple, cast, get_args, get_type_hints
 
 import numpy as np
@@ -84,7 +84,7 @@ class OutlierResult(NamedTuple):
     iqr_upper: float
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NumberHint(AnalysisHint):
     """Unified hint for numeric distribution generation."""
 
@@ -103,9 +103,16 @@ class NumberHint(AnalysisHint):
     expon: ExponentialDistribution | None = None
     weibull: WeibullDistribution | None = None
 
+    # Sampler arguments derived from the distribution parameters
+    _gamma_scale: float = field(init=False, repr=False, compare=False)
+    _lognorm_mu: float = field(init=False, repr=False, compare=False)
+    _expon_lambd: float = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Convert list arguments to NamedTuple instances for distribution parameters."""
         for field_name, field_type in get_type_hints(self.__class__).items():
+            if field_name.startswith("_"):
+                continue  # Derived fields are set below
             value = getattr(self, field_name)
             if isinstance(value, list):
                 for arg in get_args(field_type):
@@ -113,6 +120,14 @@ class NumberHint(AnalysisHint):
                         object.__setattr__(self, field_name, arg(*value))
                         break
 
+        # gammavariate() takes a scale, lognormvariate() a mu and expovariate() a rate
+        gamma_scale = 1 / self.gamma.beta if self.gamma is not None and self.gamma.beta else 0.0
+        lognorm_mu = math.log(self.lognorm.scale) if self.lognorm is not None and self.lognorm.scale > 0 else 0.0
+        expon_lambd = 1 / self.expon.scale if self.expon is not None and self.expon.scale > 0 else 1.0
+        object.__setattr__(self, "_gamma_scale", gamma_scale)
+        object.__setattr__(self, "_lognorm_mu", lognorm_mu)
+        object.__setattr__(self, "_expon_lambd", expon_lambd)
+
     @classmethod
     def create_from_values(cls, values: Sequence[SimpleType]) -> AnalysisHint | None:
         """Create a NumberHint from a list of values by analyzing their distribution.
@@ -160,15 +175,13 @@ class NumberHint(AnalysisHint):
             if self.norm is not None:
                 value = random.normalvariate(self.norm.mean, self.norm.std)
             elif self.gamma is not None:
-                value = random.gammavariate(self.gamma.alpha, 1 / self.gamma.beta) + self.gamma.loc
+                value = random.gammavariate(self.gamma.alpha, self._gamma_scale) + self.gamma.loc
             elif self.beta is not None:
                 value = self.beta.loc + self.beta.scale * random.betavariate(self.beta.a, self.beta.b)
             elif self.lognorm is not None:
-                mu = math.log(self.lognorm.scale) if self.lognorm.scale > 0 else 0
-                value = random.lognormvariate(mu, self.lognorm.s) + self.lognorm.loc
+                value = random.lognormvariate(self._lognorm_mu, self.lognorm.s) + self.lognorm.loc
             elif self.expon is not None:
-                lambd = 1 / self.expon.scale if self.expon.scale > 0 else 1
-                value = random.expovariate(lambd) + self.expon.loc
+                value = random.expovariate(self._expon_lambd) + self.expon.loc
             elif self.weibull is not None:
                 value = random.weibullvariate(self.weibull.scale, self.weibull.c) + self.weibull.loc
             elif isinstance(self.min, int) and isinstance(self.max, int):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING, Any
 
 from factoreally.hints.number_hint import NumberHint
@@ -13,12 +13,20 @@ if TYPE_CHECKING:
     from factoreally.hints.base import AnalysisHint, SimpleType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NumberStringHint(NumberHint):
     """Hint for numeric values that should be generated as strings."""
 
     type: str = "NUMSTR"
 
+    # String form of the only possible value when min == max, otherwise None
+    _const: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Set up the NumberHint fields, plus _const for single-value ranges."""
+        NumberHint.__post_init__(self)
+        object.__setattr__(self, "_const", str(self.min) if self.min == self.max else None)
+
     @classmethod
     def create_from_values(cls, values: Sequence[SimpleType]) -> AnalysisHint | None:
         """Create NumberStringHint from sample values if they're all numeric digits."""
@@ -34,16 +42,19 @@ class NumberStringHint(NumberHint):
                 except ValueError:
                     return None
 
-        if number_hint := super().create_from_values(values):
-            return cls(**asdict(number_hint))
+        if number_hint := NumberHint.create_from_values(values):
+            # Copy only the init fields, since derived fields are recomputed by __post_init__
+            return cls(**{f.name: getattr(number_hint, f.name) for f in fields(number_hint) if f.init})
 
         return None
 
     def process_value(self, value: Any, call_next: Callable[[Any], Any]) -> Any:
         """Process value through numeric string hint - generate number then convert to string."""
+        if value is None and self._const is not None:
+            return self._const
 
         # First generate a numeric value using parent logic
-        value = super().process_value(value, call_next)
+        value = NumberHint.process_value(self, value, call_next)
 
         # Convert numbers to string
         if isinstance(value, int | float):
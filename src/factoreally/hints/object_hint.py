@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from factoreally.hints.base import AnalysisHint
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ObjectHint(AnalysisHint):
     """Hint marking a field as an object type with dynamic keys."""
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from factoreally.hints.number_hint import NumberHint
@@ -82,13 +82,26 @@ LOREM_WORDS = [
     "laborum",
 ]
 
+# All lorem ipsum words as a single space-separated text
+_LOREM_TEXT = " ".join(LOREM_WORDS)
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TextHint(NumberHint):
     """Hint for generating lorem ipsum text with length distribution."""
 
     type: str = "TEXT"
 
+    # Lorem ipsum words joined into one text that is longer than any target length
+    _lorem: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Join the lorem ipsum words once, so generating text is a single slice."""
+        NumberHint.__post_init__(self)
+        max_length = int(max(1, self.max))
+        repeats = (max_length + 2) // (len(_LOREM_TEXT) + 1) + 1
+        object.__setattr__(self, "_lorem", " ".join([_LOREM_TEXT] * repeats))
+
     @classmethod
     def create_from_values(cls, values: Sequence[SimpleType]) -> AnalysisHint | None:
         """Create TextHint from sample values if they match text pattern.
@@ -125,37 +138,12 @@ class TextHint(NumberHint):
         """Process value through text hint - generate lorem ipsum if no input, continue chain."""
         if value is None:
             # Get target length from NumberHint distribution
-            target_length = super().process_value(None, lambda x: x)
+            target_length = NumberHint.process_value(self, None, lambda x: x)
             target_length = int(max(1, target_length))  # Ensure positive integer
 
-            # Generate lorem ipsum text to target length
-            words: list[str] = []
-            current_length = 0
-            word_index = 0
-
-            while current_length < target_length:
-                word = LOREM_WORDS[word_index % len(LOREM_WORDS)]
-                word_index += 1
-
-                # Add space if not first word
-                if words:
-                    needed_length = target_length - current_length
-                    space_and_word = " " + word
-                    if len(space_and_word) <= needed_length:
-                        words.append(space_and_word)
-                        current_length += len(space_and_word)
-                    else:
-                        # If adding this word would exceed target, stop
-                        break
-                elif len(word) <= target_length:
-                    # First word, no space needed
-                    words.append(word)
-                    current_length += len(word)
-                else:
-                    # If even first word is too long, truncate it
-                    words.append(word[:target_length])
-                    break
-
-            value = "".join(words)
+            # Cut the lorem ipsum text at the last word boundary within the target length,
+            # or truncate the first word if even that is too long
+            end = self._lorem.rfind(" ", 0, target_length + 1)
+            value = self._lorem[: end if end != -1 else target_length]
 
         return call_next(value)
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import random
 import re
-import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Self
 
@@ -12,8 +12,12 @@ from factoreally.hints.base import AnalysisHint
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Masks for setting the version (4) and RFC 4122 variant bits of a random 128-bit integer
+_UUID4_CLEAR_MASK = ~((0xF000 << 64) | (0xC000 << 48)) & ((1 << 128) - 1)
+_UUID4_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Uuid4Hint(AnalysisHint):
     """Hint for UUID4 pattern generation."""
 
@@ -31,5 +35,8 @@ class Uuid4Hint(AnalysisHint):
     def process_value(self, value: Any, call_next: Callable[[Any], Any]) -> Any:
         """Process value through UUID4 hint - generate UUID if no input, continue chain."""
         if value is None:
-            value = str(uuid.uuid4())
+            # Format the random bits directly, which is much faster than str(uuid.uuid4()) and
+            # draws from the same random generator as the other hints.
+            h = f"{random.getrandbits(128) & _UUID4_CLEAR_MASK | _UUID4_SET_BITS:032x}"
+            value = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
         return call_next(value)
@@ -38,8 +38,8 @@ def build_json_spec(
         field_hints = {}
         for hint in _get_hints(field, extracted, analyzers):
             hint_dict = asdict(hint)
-            # Filter out None values to keep only meaningful data
-            filtered_hint = {k: v for k, v in hint_dict.items() if v is not None}
+            # Filter out None values and private derived fields to keep only meaningful data
+            filtered_hint = {k: v for k, v in hint_dict.items() if v is not None and not k.startswith("_")}
             # Remove 'type' from params since it becomes the key
             hint_type = filtered_hint.pop("type")
             field_hints[hint_type] = filtered_hint
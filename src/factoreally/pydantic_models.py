@@ -5,11 +5,23 @@ from __future__ import annotations
 import collections.abc
 import importlib
 import inspect
-from typing import Any, ForwardRef, get_args, get_origin
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Any, ForwardRef, get_args, get_origin
 
 import click
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
+# Generic origins of annotations that are always dynamic dicts, checked with one hash lookup
+_DICT_ORIGINS = frozenset({dict, collections.abc.Mapping, collections.abc.MutableMapping})
+
+# Dynamic field paths of models whose schema is complete. Incomplete models (forward references
+# still pending) are analyzed every time, since model_rebuild() can still change their fields.
+_complete_model_fields: dict[type[BaseModel], frozenset[str]] = {}
+
 
 def analyze_pydantic_model(model_class: type[BaseModel]) -> set[str]:
     """Analyze a Pydantic model to detect fields with dynamic keys.
@@ -23,6 +35,15 @@ def analyze_pydantic_model(model_class: type[BaseModel]) -> set[str]:
     Returns:
         Set of field paths that should be treated as dynamic objects
     """
+    # Return a copy so callers can't modify the cached result
+    return set(_analyze_model(model_class))
+
+
+def _analyze_model(model_class: type[BaseModel]) -> frozenset[str]:
+    """Analyze a Pydantic model, reusing the result for nested and repeated complete models."""
+    if (cached := _complete_model_fields.get(model_class)) is not None:
+        return cached
+
     dynamic_fields: set[str] = set()
 
     # Get the model fields
@@ -31,7 +52,8 @@ def analyze_pydantic_model(model_class: type[BaseModel]) -> set[str]:
     for field_name, field_info in model_fields.items():
         field_annotation = field_info.annotation
 
-        json_field_name = field_info.alias or field_name
+        # Interned, since the same field names and paths recur across models and are used as lookup keys
+        json_field_name = sys.intern(field_info.alias or field_name)
 
         # Check if this field is a dictionary type with string keys
         if _is_dynamic_dict_field(field_annotation):
@@ -40,11 +62,14 @@ def analyze_pydantic_model(model_class: type[BaseModel]) -> set[str]:
         # Handle nested models recursively
         nested_model_class = _resolve_nested_model(field_annotation, model_class)
         if nested_model_class:
-            nested_dynamic_fields = analyze_pydantic_model(nested_model_class)
+            nested_dynamic_fields = _analyze_model(nested_model_class)
             for nested_field in nested_dynamic_fields:
-                dynamic_fields.add(f"{json_field_name}.{nested_field}")
+                dynamic_fields.add(sys.intern(f"{json_field_name}.{nested_field}"))
 
-    return dynamic_fields
+    result = frozenset(dynamic_fields)
+    if model_class.__pydantic_complete__:
+        _complete_model_fields[model_class] = result
+    return result
 
 
 def _is_dynamic_dict_field(annotation: Any) -> bool:
@@ -59,7 +84,7 @@ def _is_dynamic_dict_field(annotation: Any) -> bool:
     origin = get_origin(annotation)
 
     # Check for dict and Mapping types (includes collections.abc.Mapping and MutableMapping)
-    if origin in (dict, collections.abc.Mapping, collections.abc.MutableMapping):
+    if origin in _DICT_ORIGINS:
         return True
 
     # Check for Union types (e.g., dict[str, str] | None)
@@ -154,7 +179,7 @@ def _resolve_from_module(annotation: str, parent_model: type[BaseModel]) -> type
         module_globals = globals()[model_module]
     else:
         try:
-            module = importlib.import_module(model_module)
+            module = _import_module(model_module)
             module_globals = vars(module)
         except ImportError:
             return None
@@ -169,19 +194,38 @@ def _resolve_from_module(annotation: str, parent_model: type[BaseModel]) -> type
 
 def _resolve_from_frame_globals(annotation: str) -> type[BaseModel] | None:
     """Resolve annotation from calling frame globals (mainly for testing)."""
+    # Walk the frames directly rather than using inspect.stack(), which builds
+    # FrameInfo objects (reading source context lines) for the entire stack
+    frame = inspect.currentframe()
     try:
         # Get the calling frame (skip this function and the one that called it)
-        for frame_info in inspect.stack()[2:4]:  # Check 2 frames up
-            frame_globals = frame_info.frame.f_globals
+        for _ in range(2):
+            frame = frame.f_back if frame else None
+        for _ in range(2):  # Check 2 frames up
+            if frame is None:
+                break
+            frame_globals = frame.f_globals
             if annotation in frame_globals:
                 resolved_type = frame_globals[annotation]
                 if isinstance(resolved_type, type) and issubclass(resolved_type, BaseModel):
                     return resolved_type
-    except (AttributeError, TypeError, IndexError):
+            frame = frame.f_back
+    except (AttributeError, TypeError):
         pass
+    finally:
+        del frame  # Avoid a reference cycle through this frame
     return None
 
 
+@cache
+def _import_module(module_path: str) -> ModuleType:
+    """Import a module, remembering it so repeated lookups skip the import machinery.
+
+    Failed imports raise as usual and are not cached.
+    """
+    return importlib.import_module(module_path)
+
+
 def import_pydantic_model(import_path: str) -> type[BaseModel]:
     """Import a Pydantic model from a Python import path.
 
@@ -209,7 +253,7 @@ def import_pydantic_model(import_path: str) -> type[BaseModel]:
 
         # Import the module
         try:
-            module = importlib.import_module(module_path)
+            module = _import_module(module_path)
         except ImportError as e:
             msg = f"Cannot import module '{module_path}': {e}"
             raise click.ClickException(msg) from e
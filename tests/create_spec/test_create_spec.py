@@ -32,6 +32,25 @@ def test_create_spec_empty_list() -> None:
     }
 
 
+def test_create_spec_alphanumeric_codes() -> None:
+    """Test create_spec with fixed-length codes only includes the ALPHA chrs parameter."""
+    sample_data = [{"code": f"{letter}{digit}"} for letter in "ABCDEFGHIJ" for digit in "01234"]
+
+    spec_data = create_spec(sample_data)
+
+    assert spec_data == {
+        "metadata": {
+            "samples_analyzed": 50,
+            "data_points": 50,
+        },
+        "fields": {
+            "code": {
+                "ALPHA": {"chrs": {"ABCDEFGHIJ": [0], "01234": [1]}},
+            },
+        },
+    }
+
+
 def test_create_spec_list_timestamps() -> None:
     """Test create_spec with timestamp list data."""
     start = datetime.now(tz=UTC)
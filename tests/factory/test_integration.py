@@ -1,13 +1,96 @@
 """Tests for Factory integration and complex scenarios."""
 
+import itertools
 from datetime import date
 from typing import Any
 
+import pytest
 from pydantic import BaseModel
 
 from factoreally import Factory
 from factoreally.create_spec import create_spec
 
+# Every model used in this module is declared here so pydantic builds each schema once at import.
+# Variants that differ only in annotations (e.g. dict[str, T] vs dict[date, T]) are declared separately.
+
+
+class _Nested(BaseModel):
+    height: int
+
+
+class _ElementModel(BaseModel):
+    age: int
+
+
+class _IntegrationTestModel(BaseModel):
+    name: str
+    dynamic: dict[str, str] | None  # Dynamic object field
+    nested: _Nested | None  # Static object field
+    elements: list[_ElementModel] | None  # Dynamic array field
+
+
+class _DailyMetrics(BaseModel):
+    total_users: int
+
+
+class _DateStringKeysTestModel(BaseModel):
+    name: str
+    daily_metrics: dict[str, _DailyMetrics]  # Dynamic object with date keys
+
+
+class _DateKeysTestModel(BaseModel):
+    name: str
+    daily_metrics: dict[date, _DailyMetrics]  # Dynamic object with date keys, using date type annotation
+
+
+class _UserProfile(BaseModel):
+    name: str
+    age: int
+
+
+class _ActionData(BaseModel):
+    action_type: str = "default"
+    timestamp: str = "2024-01-01T00:00:00Z"
+
+
+class _ComplexDateKeysTestModel(BaseModel):
+    user: _UserProfile
+    daily_actions: dict[str, list[_ActionData]]  # Dynamic date keys with arrays
+
+
+# Expected spec for the test_pydantic_model_integration sample data analyzed with _IntegrationTestModel
+_EXPECTED_PYDANTIC_MODEL_SPEC: dict[str, Any] = {
+    "metadata": {
+        "samples_analyzed": 4,
+        "data_points": 23,
+    },
+    "fields": {
+        "dynamic": {
+            "OBJECT": {},
+            "NUMBER": {"min": 2, "max": 3},
+            "UUID4": {},
+            "NULL": {"pct": 33.333},
+            "MISSING": {"pct": 25.0},
+        },
+        "dynamic.{}": {
+            "CHOICE": {
+                "choices": ["value1", "value2", "value3", "value4", "value5"],
+                "weights": [0.2, 0.2, 0.2, 0.2, 0.2],
+            },
+        },
+        "elements": {
+            "ARRAY": {},
+            "NUMBER": {"min": 2, "max": 2},
+            "NULL": {"pct": 33.333},
+            "MISSING": {"pct": 25.0},
+        },
+        "elements[].age": {"NUMBER": {"min": 20, "max": 26}},
+        "name": {"CHOICE": {"choices": ["Alice", "Bob", "Carol", "Jan"], "weights": [0.25, 0.25, 0.25, 0.25]}},
+        "nested": {"NULL": {"pct": 33.333}, "MISSING": {"pct": 25.0}},
+        "nested.height": {"NUMBER": {"min": 160, "max": 170}},
+    },
+}
+
 
 def test_integration_all_features(simple_factory_spec: Factory) -> None:
     """Integration test using all Factory features together."""
@@ -29,11 +112,7 @@ def test_integration_all_features(simple_factory_spec: Factory) -> None:
         assert isinstance(item["data"]["count"], int)  # Generated field
 
     # Use iterator to generate more items
-    iterator_items = []
-    for i, item in enumerate(copy_factory):
-        iterator_items.append(item)
-        if i >= 1:
-            break
+    iterator_items = list(itertools.islice(copy_factory, 2))
 
     assert len(iterator_items) == 2
     for item in iterator_items:
@@ -43,20 +122,6 @@ def test_integration_all_features(simple_factory_spec: Factory) -> None:
 
 def test_pydantic_model_integration() -> None:
     """Test integration of Pydantic model analysis with create_spec."""
-
-    class Nested(BaseModel):
-        height: int
-
-    class ElementModel(BaseModel):
-        age: int
-
-    class TestModel(BaseModel):
-        name: str
-        dynamic: dict[str, str] | None  # Dynamic object field
-        nested: Nested | None  # Static object field
-        elements: list[ElementModel] | None  # Dynamic array field
-
-    # Sample data matching the model structure
     sample_data: list[dict[str, Any]] = [
         {
             "name": "Alice",
@@ -89,42 +154,10 @@ def test_pydantic_model_integration() -> None:
     ]
 
     # Create spec with Pydantic model
-    spec = create_spec(sample_data, model=TestModel)
+    spec = create_spec(sample_data, model=_IntegrationTestModel)
 
     # Assert the complete spec structure
-    expected_spec = {
-        "metadata": {
-            "samples_analyzed": 4,
-            "data_points": 23,
-        },
-        "fields": {
-            "dynamic": {
-                "OBJECT": {},
-                "NUMBER": {"min": 2, "max": 3},
-                "UUID4": {},
-                "NULL": {"pct": 33.333},
-                "MISSING": {"pct": 25.0},
-            },
-            "dynamic.{}": {
-                "CHOICE": {
-                    "choices": ["value1", "value2", "value3", "value4", "value5"],
-                    "weights": [0.2, 0.2, 0.2, 0.2, 0.2],
-                },
-            },
-            "elements": {
-                "ARRAY": {},
-                "NUMBER": {"min": 2, "max": 2},
-                "NULL": {"pct": 33.333},
-                "MISSING": {"pct": 25.0},
-            },
-            "elements[].age": {"NUMBER": {"min": 20, "max": 26}},
-            "name": {"CHOICE": {"choices": ["Alice", "Bob", "Carol", "Jan"], "weights": [0.25, 0.25, 0.25, 0.25]}},
-            "nested": {"NULL": {"pct": 33.333}, "MISSING": {"pct": 25.0}},
-            "nested.height": {"NUMBER": {"min": 160, "max": 170}},
-        },
-    }
-
-    assert spec == expected_spec
+    assert spec == _EXPECTED_PYDANTIC_MODEL_SPEC
 
     # Additional specific assertions for clarity
     dynamic_field_spec = spec["fields"]["dynamic"]
@@ -141,17 +174,15 @@ def test_pydantic_model_integration() -> None:
     assert dynamic_number_spec["max"] == 3
 
 
-def test_dynamic_object_with_date_string_keys() -> None:
-    """Test dynamic objects where keys are dates and spec contains '{}' suffix."""
-
-    class DailyMetrics(BaseModel):
-        total_users: int
-
-    class TestModel(BaseModel):
-        name: str
-        daily_metrics: dict[str, DailyMetrics]  # Dynamic object with date keys
-
-    # Sample data with date keys
+@pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param(_DateStringKeysTestModel, id="dict_str_keys"),
+        pytest.param(_DateKeysTestModel, id="dict_date_keys"),
+    ],
+)
+def test_dynamic_object_with_date_keys(model: type[BaseModel]) -> None:
+    """Test dynamic objects where keys are dates, annotated as dict[str, T] or dict[date, T]."""
     sample_data = [
         {
             "name": "Report A",
@@ -173,68 +204,7 @@ def test_dynamic_object_with_date_string_keys() -> None:
     ]
 
     # Create spec with the model
-    spec = create_spec(sample_data, model=TestModel)
-
-    # Assert the complete spec structure
-    expected_spec = {
-        "metadata": {
-            "samples_analyzed": 2,
-            "data_points": 16,
-        },
-        "fields": {
-            "daily_metrics": {
-                "OBJECT": {},
-                "NUMBER": {"min": 3, "max": 4},
-                "DATE": {"min": "2025-01-05", "max": "2025-01-11"},
-            },
-            "daily_metrics.{}.total_users": {
-                "NUMBER": {"min": 95, "max": 125},
-            },
-            "name": {
-                "CHOICE": {
-                    "choices": ["Report A", "Report B"],
-                    "weights": [0.5, 0.5],
-                },
-            },
-        },
-    }
-
-    assert spec == expected_spec
-
-
-def test_dynamic_object_with_date_keys() -> None:
-    """Test dynamic objects where keys are dates using dict[date, T] annotation."""
-
-    class DailyMetrics(BaseModel):
-        total_users: int
-
-    class TestModel(BaseModel):
-        name: str
-        daily_metrics: dict[date, DailyMetrics]  # Dynamic object with date keys, using date type annotation
-
-    # Sample data with date keys
-    sample_data = [
-        {
-            "name": "Report A",
-            "daily_metrics": {
-                "2025-01-05": {"total_users": 100},
-                "2025-01-06": {"total_users": 120},
-                "2025-01-07": {"total_users": 110},
-            },
-        },
-        {
-            "name": "Report B",
-            "daily_metrics": {
-                "2025-01-08": {"total_users": 95},
-                "2025-01-09": {"total_users": 105},
-                "2025-01-10": {"total_users": 125},
-                "2025-01-11": {"total_users": 115},
-            },
-        },
-    ]
-
-    # Create spec with the model
-    spec = create_spec(sample_data, model=TestModel)
+    spec = create_spec(sample_data, model=model)
 
     # Assert the complete spec structure
     expected_spec = {
@@ -265,20 +235,6 @@ def test_dynamic_object_with_date_keys() -> None:
 
 def test_complex_nested_dynamic_date_keys_with_aliases() -> None:
     """Test complex nested structures with dynamic date keys and model aliases."""
-
-    class UserProfile(BaseModel):
-        name: str
-        age: int
-
-    class ActionData(BaseModel):
-        action_type: str = "default"
-        timestamp: str = "2024-01-01T00:00:00Z"
-
-    class TestModel(BaseModel):
-        user: UserProfile
-        daily_actions: dict[str, list[ActionData]]  # Dynamic date keys with arrays
-
-    # Sample data with complex nested dynamic structure
     sample_data = [
         {
             "user": {"name": "Alice", "age": 30},
@@ -305,7 +261,7 @@ def test_complex_nested_dynamic_date_keys_with_aliases() -> None:
     ]
 
     # Create spec with the model
-    spec = create_spec(sample_data, model=TestModel)
+    spec = create_spec(sample_data, model=_ComplexDateKeysTestModel)
 
     # Verify the dynamic object structure is correctly identified
     daily_actions_spec = spec["fields"]["daily_actions"]
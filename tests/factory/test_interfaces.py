@@ -1,6 +1,7 @@
 """Tests for Factory interface methods (copy, slice, iteration)."""
 
 import itertools
+from typing import Any
 
 import pytest
 
@@ -47,6 +48,17 @@ def test_copy(simple_factory_spec: Factory) -> None:
     assert original_data["data"]["count"] != 333
 
 
+def test_copy_shares_factory_spec(simple_factory_spec: Factory) -> None:
+    """Test Factory.copy shares the parsed spec and only copies overrides."""
+    factory = simple_factory_spec.copy(name="base-name")
+
+    factory_copy = factory.copy(id="copy-id")
+
+    assert factory_copy._factory_spec is factory._factory_spec
+    assert factory_copy._overrides is not factory._overrides
+    assert factory._overrides == {"name": "base-name"}
+
+
 def test_copy_with_base_overrides(simple_factory_spec: Factory) -> None:
     """Test Factory.copy preserves base overrides."""
     # Create factory with base overrides
@@ -91,29 +103,22 @@ def test_slice_interface(simple_factory_spec: Factory) -> None:
     assert all(isinstance(data, dict) for data in data_list)
 
 
-def test_slice_interface_edge_cases(simple_factory_spec: Factory) -> None:
+@pytest.mark.parametrize(
+    ("key", "match"),
+    [
+        # Slices without a stop value
+        (slice(10, None), "Slice stop value is required"),
+        (slice(None, None), "Slice stop value is required"),
+        # Integer, negative and invalid key types
+        (0, "Only slice indexing is supported"),
+        (-1, "Only slice indexing is supported"),
+        ("invalid", "Only slice indexing is supported"),
+    ],
+)
+def test_slice_interface_edge_cases(simple_factory_spec: Factory, key: Any, match: str) -> None:
     """Test Factory slice interface edge cases."""
-    factory = simple_factory_spec
-
-    # Test that slice without stop value raises error
-    with pytest.raises(TypeError, match="Slice stop value is required"):
-        factory[10:]
-
-    # Test that slice without stop value raises error
-    with pytest.raises(TypeError, match="Slice stop value is required"):
-        factory[:]
-
-    # Test integer index raises error
-    with pytest.raises(TypeError, match="Only slice indexing is supported"):
-        factory[0]
-
-    # Test negative index raises error
-    with pytest.raises(TypeError, match="Only slice indexing is supported"):
-        factory[-1]
-
-    # Test invalid key type raises error
-    with pytest.raises(TypeError, match="Only slice indexing is supported"):
-        factory["invalid"]
+    with pytest.raises(TypeError, match=match):
+        simple_factory_spec[key]
 
 
 def test_iter_interface(simple_factory_spec: Factory) -> None:
@@ -125,11 +130,7 @@ def test_iter_interface(simple_factory_spec: Factory) -> None:
     assert iterator is factory  # Returns self
 
     # Test generating values from iterator
-    data_list = []
-    for i, data in enumerate(factory):
-        data_list.append(data)
-        if i >= 4:  # Generate 5 items
-            break
+    data_list = list(itertools.islice(factory, 5))
 
     assert len(data_list) == 5
     assert all(isinstance(data, dict) for data in data_list)
@@ -141,12 +142,8 @@ def test_iter_interface(simple_factory_spec: Factory) -> None:
     assert all(isinstance(data, dict) for data in islice_data)
     assert all("id" in data for data in islice_data)
 
-    # Test direct iteration with for loop
-    direct_iter_data = []
-    for data in factory:
-        direct_iter_data.append(data)
-        if len(direct_iter_data) >= 2:  # Generate 2 items
-            break
+    # Test iteration via the iterator returned by iter()
+    direct_iter_data = list(itertools.islice(iter(factory), 2))
 
     assert len(direct_iter_data) == 2
     assert all(isinstance(data, dict) for data in direct_iter_data)
@@ -1,5 +1,7 @@
 """Tests for Factory null handling functionality."""
 
+from collections import Counter
+
 from factoreally import Factory
 
 
@@ -17,11 +19,8 @@ def test_build_null_hint_with_child_fields_100_percent() -> None:
 
     factory = Factory(spec_data)
 
-    # Test multiple times to ensure consistency with 100% null
-    for _ in range(10):
-        result = factory.build()
-        assert "wand" in result
-        assert result["wand"] is None
+    result = factory.build()
+    assert result["wand"] is None
 
 
 def test_build_null_hint_with_child_fields_mixed() -> None:
@@ -38,26 +37,21 @@ def test_build_null_hint_with_child_fields_mixed() -> None:
 
     factory = Factory(spec_data)
 
-    # Test multiple times to see both null and non-null cases
-    null_count = 0
-    object_count = 0
+    # Generate a batch to see both null and non-null cases
+    results = factory[0:40]
+    assert all("wand" in result for result in results)
 
-    for _ in range(100):
-        result = factory.build()
-        assert "wand" in result
+    counts = Counter(result["wand"] is None for result in results)
+    null_count = counts[True]
+    object_count = counts[False]
 
-        if result["wand"] is None:
-            null_count += 1
-        else:
-            object_count += 1
-            # When not null, should be proper object
-            assert isinstance(result["wand"], dict)
-            assert "model" in result["wand"]
-            assert result["wand"]["model"] == "M2000"
+    # When not null, should be proper object
+    expected_wand = {"model": "M2000"}
+    assert all(result["wand"] == expected_wand for result in results if result["wand"] is not None)
 
     # Should have approximately 50% null and 50% objects (with some variance)
-    assert 30 <= null_count <= 70  # Allow for randomness variance
-    assert 30 <= object_count <= 70
+    assert 10 <= null_count <= 30  # Allow for randomness variance
+    assert 10 <= object_count <= 30
 
 
 def test_build_null_hint_with_nested_child_fields() -> None:
@@ -75,8 +69,5 @@ def test_build_null_hint_with_nested_child_fields() -> None:
 
     factory = Factory(spec_data)
 
-    # Test multiple times to ensure consistency
-    for _ in range(10):
-        result = factory.build()
-        assert "device" in result
-        assert result["device"] is None
+    result = factory.build()
+    assert result["device"] is None
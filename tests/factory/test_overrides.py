@@ -1,5 +1,8 @@
 """Tests for Factory override functionality (static and callable)."""
 
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import pytest
@@ -7,6 +10,19 @@ import pytest
 from factoreally import Factory
 
 
+@pytest.fixture
+def single_name_factory() -> Factory:
+    """Create Factory with a single constant name field, shared by the error tests."""
+    return Factory(
+        {
+            "fields": {
+                "name": {"CONST": {"val": "test"}},
+            },
+            "metadata": {},
+        }
+    )
+
+
 def test_build_with_overrides(simple_factory_spec: Factory) -> None:
     """Test Factory.build with override arguments."""
     factory = simple_factory_spec
@@ -184,15 +200,9 @@ def test_callable_override_mixed_with_static() -> None:
     assert result["flag"] is True
 
 
-def test_callable_override_invalid_signatures() -> None:
+def test_callable_override_invalid_signatures(single_name_factory: Factory) -> None:
     """Test error handling for invalid callable signatures."""
-    spec_data = {
-        "fields": {
-            "name": {"CONST": {"val": "test"}},
-        },
-        "metadata": {},
-    }
-    factory = Factory(spec_data)
+    factory = single_name_factory
 
     # Test too many positional parameters
     def invalid_too_many_args(_a: Any, _b: Any, _c: Any) -> str:
@@ -209,6 +219,46 @@ def test_callable_override_invalid_signatures() -> None:
         factory.build(name=invalid_keyword_param)
 
 
+def test_callable_override_wrapped_function() -> None:
+    """Test callable override decorated with functools.wraps uses the wrapped signature."""
+    spec_data = {
+        "fields": {
+            "name": {"CONST": {"val": "alice"}},
+        },
+        "metadata": {},
+    }
+    factory = Factory(spec_data)
+
+    def passthrough(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @passthrough
+    def shout(value: str) -> str:
+        return value.upper()
+
+    # The wrapper's (*args, **kwargs) signature must not be used
+    assert factory.build(name=shout)["name"] == "ALICE"
+
+
+def test_callable_override_unhashable_callable(single_name_factory: Factory) -> None:
+    """Test callable override with an unhashable callable object."""
+    factory = single_name_factory
+
+    @dataclass
+    class Shout:
+        suffix: str
+
+        def __call__(self, value: str) -> str:
+            return f"{value.upper()}{self.suffix}"
+
+    # Dataclass instances with eq=True are unhashable
+    assert factory.build(name=Shout("!"))["name"] == "TEST!"
+
+
 def test_callable_override_copy_method() -> None:
     """Test callable overrides work with Factory.copy() method."""
     spec_data = {
@@ -232,15 +282,9 @@ def test_callable_override_copy_method() -> None:
     assert original_result["name"] == "base"
 
 
-def test_callable_override_error_handling() -> None:
+def test_callable_override_error_handling(single_name_factory: Factory) -> None:
     """Test error handling when callables raise exceptions."""
-    spec_data = {
-        "fields": {
-            "name": {"CONST": {"val": "test"}},
-        },
-        "metadata": {},
-    }
-    factory = Factory(spec_data)
+    factory = single_name_factory
 
     # Test callable that raises exception
     def failing_callable(_value: Any) -> str:
@@ -120,3 +120,16 @@ def test_build_array_with_missing_hint() -> None:
 
     # With pct=100.0 (always missing), the field should not be in the result
     assert "events" not in result
+
+
+def test_build_object_with_missing_leaf() -> None:
+    """Test that leaf fields with a MISSING hint are excluded from the built object."""
+    field_path_hints: dict[str, list[AnalysisHint]] = {
+        "name": [ConstantValueHint(val="Alice"), MissingHint(type="MISSING", pct=100.0)],
+        "age": [ConstantValueHint(val=30)],
+    }
+
+    spec = FactorySpec(field_path_hints)
+    result = spec.build()
+
+    assert result == {"age": 30}
@@ -1,5 +1,8 @@
 """Tests for load_factory_spec function."""
 
+import json
+from pathlib import Path
+
 from factoreally.factory_spec import FactorySpec, load_factory_spec
 
 
@@ -33,3 +36,18 @@ def test_load_factory_spec_with_metadata() -> None:
     assert isinstance(factory_spec, FactorySpec)
     result = factory_spec.build()
     assert result == {"id": 1, "name": "test_user"}
+
+
+def test_load_factory_spec_from_file(tmp_path: Path) -> None:
+    """Test loading FactorySpec from a JSON file given as a Path or a string."""
+    spec_dict = {
+        "metadata": {},
+        "fields": {
+            "name": {"CONST": {"val": "tëst"}},
+        },
+    }
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(spec_dict, ensure_ascii=False), encoding="utf-8")
+
+    assert load_factory_spec(spec_path).build() == {"name": "tëst"}
+    assert load_factory_spec(str(spec_path)).build() == {"name": "tëst"}
@@ -0,0 +1,39 @@
+"""Shared fixtures for hint tests."""
+
+import random
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _seed_random() -> Iterator[None]:
+    """Seed the global random generator so that probabilistic hint tests are deterministic.
+
+    The previous generator state is restored afterwards so other test modules are unaffected.
+    """
+    state = random.getstate()
+    random.seed(12345)
+    yield
+    random.setstate(state)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@pytest.fixture
+def identity() -> Callable[[Any], Any]:
+    """Return a call_next function that passes values through unchanged."""
+    return _identity
+
+
+@pytest.fixture
+def identity_mock() -> Mock:
+    """Return a pass-through call_next mock for tests that assert on how it was called.
+
+    Specced on a plain function so the mock does not create child mocks on attribute access.
+    """
+    return Mock(spec=_identity, side_effect=_identity)
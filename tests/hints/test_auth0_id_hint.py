@@ -1,5 +1,7 @@
 """Test Auth0 ID hint functionality."""
 
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import Mock
 
 from factoreally.hints.auth0_id_hint import Auth0IdHint
@@ -12,12 +14,11 @@ def test_auth0_id_hint_basic_creation() -> None:
     assert hint.type == "AUTH0_ID"
 
 
-def test_auth0_id_hint_process_value_with_none_generates_id() -> None:
+def test_auth0_id_hint_process_value_with_none_generates_id(identity_mock: Mock) -> None:
     """Test that process_value generates Auth0 ID when input is None."""
     hint = Auth0IdHint()
-    call_next = Mock(side_effect=lambda x: x)
 
-    result = hint.process_value(None, call_next)
+    result = hint.process_value(None, identity_mock)
 
     assert isinstance(result, str)
     assert result.startswith("auth0|")
@@ -28,27 +29,15 @@ def test_auth0_id_hint_process_value_with_none_generates_id() -> None:
     assert len(hex_part) == 24
     assert all(c in "0123456789abcdef" for c in hex_part)
 
-    call_next.assert_called_once()
+    identity_mock.assert_called_once()
 
 
-def test_auth0_id_hint_process_value_with_existing_value_passes_through() -> None:
-    """Test that process_value passes through existing non-None values."""
-    hint = Auth0IdHint()
-    call_next = Mock(side_effect=lambda x: f"processed_{x}")
-
-    result = hint.process_value("existing_id", call_next)
-
-    assert result == "processed_existing_id"
-    call_next.assert_called_once_with("existing_id")
-
-
-def test_auth0_id_hint_generates_unique_ids() -> None:
+def test_auth0_id_hint_generates_unique_ids(identity: Callable[[Any], Any]) -> None:
     """Test that generated Auth0 IDs are unique."""
     hint = Auth0IdHint()
-    call_next = Mock(side_effect=lambda x: x)
 
     # Generate multiple IDs
-    ids = [hint.process_value(None, call_next) for _ in range(10)]
+    ids = [hint.process_value(None, identity) for _ in range(10)]
 
     # All should be different
     assert len(set(ids)) == 10
@@ -59,13 +48,12 @@ def test_auth0_id_hint_generates_unique_ids() -> None:
         assert len(auth0_id) == 30
 
 
-def test_auth0_id_hint_format_validation() -> None:
+def test_auth0_id_hint_format_validation(identity: Callable[[Any], Any]) -> None:
     """Test that generated Auth0 IDs follow correct format."""
     hint = Auth0IdHint()
-    call_next = Mock(side_effect=lambda x: x)
 
     for _ in range(5):
-        result = hint.process_value(None, call_next)
+        result = hint.process_value(None, identity)
 
         # Check format: "auth0|" followed by 24 hex characters
         assert result.startswith("auth0|")
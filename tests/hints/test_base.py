@@ -1,5 +1,8 @@
 """Tests for base hint functionality."""
 
+from collections.abc import Callable
+from typing import Any
+
 from factoreally.hints import ArrayHint, ChoiceHint, ObjectHint
 from factoreally.hints.base import AnalysisHint
 
@@ -9,6 +12,12 @@ def test_analysis_hint_available() -> None:
     assert AnalysisHint is not None
 
 
+def test_hints_have_no_instance_dict() -> None:
+    """Test that hints use slots instead of a per-instance __dict__."""
+    hint = ChoiceHint(type="CHOICE", choices=["A", "B"], weights=[0.5, 0.5])
+    assert not hasattr(hint, "__dict__")
+
+
 def test_array_hint_basic_creation() -> None:
     """Test that ArrayHint can be created."""
     hint = ArrayHint(type="ARRAY")
@@ -30,39 +39,22 @@ def test_choice_hint_basic_creation() -> None:
     assert len(hint.weights) == 2
 
 
-def test_choice_hint_process_value_with_none_generates_choice() -> None:
+def test_choice_hint_process_value_with_none_generates_choice(identity: Callable[[Any], Any]) -> None:
     """Test that ChoiceHint generates choice when input is None."""
     hint = ChoiceHint(type="CHOICE", choices=["X", "Y"], weights=[70.0, 30.0])
 
-    # Test with a call_next function
-    def mock_call_next(value: str) -> str:
-        return value
-
+    # Test with an identity call_next function
     # The process_value should generate a choice
-    result = hint.process_value(None, mock_call_next)
+    result = hint.process_value(None, identity)
     assert result in ["X", "Y"]
 
 
-def test_choice_hint_process_value_with_existing_value_passes_through() -> None:
-    """Test that ChoiceHint passes through existing non-None values."""
-    hint = ChoiceHint(type="CHOICE", choices=["X", "Y"], weights=[70.0, 30.0])
-
-    def mock_call_next(value: str) -> str:
-        return f"processed_{value}"
-
-    result = hint.process_value("existing_choice", mock_call_next)
-    assert result == "processed_existing_choice"
-
-
-def test_array_hint_process_value_with_existing_value_passes_through() -> None:
+def test_array_hint_process_value_with_existing_value_passes_through(identity: Callable[[Any], Any]) -> None:
     """Test that ArrayHint passes through existing values to call_next."""
     hint = ArrayHint(type="ARRAY")
 
-    def mock_call_next(value: list[str]) -> list[str]:
-        return value
-
     # Array hint should pass through to call_next
-    result = hint.process_value([], mock_call_next)
+    result = hint.process_value([], identity)
     assert result == []
 
 
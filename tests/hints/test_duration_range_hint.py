@@ -1,9 +1,17 @@
 """Test duration range hint functionality."""
 
+import re
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import Mock
 
+import pytest
+
 from factoreally.hints.duration_range_hint import DurationRangeHint
 
+# Zero-padded "HH:MM:SS", capturing each numeric component
+_HMS_RE = re.compile(r"\A(\d{2,}):(\d{2}):(\d{2})\Z")
+
 
 def test_duration_range_hint_basic_creation() -> None:
     """Test creating a basic DurationRangeHint."""
@@ -16,98 +24,79 @@ def test_duration_range_hint_basic_creation() -> None:
     assert hint.avg == 1800.0
 
 
-def test_duration_range_hint_process_value_with_none_generates_duration() -> None:
+def test_duration_range_hint_process_value_with_none_generates_duration(identity_mock: Mock) -> None:
     """Test that process_value generates duration when input is None."""
     hint = DurationRangeHint(fmt="HMS", min=60.0, max=120.0, avg=90.0)
-    call_next = Mock(side_effect=lambda x: x)
 
-    result = hint.process_value(None, call_next)
+    result = hint.process_value(None, identity_mock)
 
     # HMS format returns formatted string
     assert isinstance(result, str)
     # Should match HH:MM:SS format
-    parts = result.split(":")
-    assert len(parts) == 3
-    # All parts should be numeric
-    hours, minutes, seconds = map(int, parts)
+    match = _HMS_RE.match(result)
+    assert match
+    hours, minutes, seconds = map(int, match.groups())
     assert 0 <= hours <= 23
     assert 0 <= minutes <= 59
     assert 0 <= seconds <= 59
 
-    call_next.assert_called_once()
-
-
-def test_duration_range_hint_process_value_with_existing_value_passes_through() -> None:
-    """Test that process_value passes through existing non-None values."""
-    hint = DurationRangeHint(fmt="HMS", min=0.0, max=100.0, avg=50.0)
-    call_next = Mock(side_effect=lambda x: f"processed_{x}")
-
-    result = hint.process_value(42, call_next)
+    identity_mock.assert_called_once()
 
-    assert result == "processed_42"
-    call_next.assert_called_once_with(42)
 
-
-def test_duration_range_hint_different_formats() -> None:
+@pytest.mark.parametrize("fmt", ["HMS", "MS", "S"])
+def test_duration_range_hint_different_formats(fmt: str, identity: Callable[[Any], Any]) -> None:
     """Test DurationRangeHint with different format types."""
-    formats = ["HMS", "MS", "S"]
-
-    for fmt in formats:
-        hint = DurationRangeHint(fmt=fmt, min=10.0, max=100.0, avg=55.0)
-        call_next = Mock(side_effect=lambda x: x)
+    hint = DurationRangeHint(fmt=fmt, min=10.0, max=100.0, avg=55.0)
 
-        result = hint.process_value(None, call_next)
+    result = hint.process_value(None, identity)
 
-        # HMS format returns string, others return numeric
-        if fmt == "HMS":
-            assert isinstance(result, str)
-            assert len(result.split(":")) == 3  # HH:MM:SS format
-        else:
-            assert isinstance(result, (int, float))
-            assert result > 0  # Duration should be positive
-        assert hint.fmt == fmt
+    # HMS format returns string, others return numeric
+    if fmt == "HMS":
+        assert isinstance(result, str)
+        assert _HMS_RE.match(result)  # HH:MM:SS format
+    else:
+        assert isinstance(result, (int, float))
+        assert result > 0  # Duration should be positive
+    assert hint.fmt == fmt
 
 
-def test_duration_range_hint_respects_bounds_approximately() -> None:
+def test_duration_range_hint_respects_bounds_approximately(identity: Callable[[Any], Any]) -> None:
     """Test that generated durations are roughly within bounds (normal distribution)."""
     hint = DurationRangeHint(fmt="S", min=10.0, max=90.0, avg=50.0)
-    call_next = Mock(side_effect=lambda x: x)
 
     # Generate multiple durations - most should be within reasonable range
-    results = [hint.process_value(None, call_next) for _ in range(20)]
+    results = [hint.process_value(None, identity) for _ in range(20)]
 
     # Normal distribution should keep most values reasonably close to bounds
     # Allow some tolerance since it's a normal distribution
-    for result in results:
-        assert isinstance(result, (int, float))
-        # Should be roughly in expected range (with some tolerance for normal distribution)
-        assert 0.0 <= result <= 150.0  # Allow some deviation from strict bounds
+    # Every sample comes from the same code path, so checking the type once is enough
+    assert isinstance(results[0], (int, float))
+    # Should be roughly in expected range (with some tolerance for normal distribution)
+    assert all(0.0 <= result <= 150.0 for result in results)  # Allow some deviation from strict bounds
 
 
-def test_duration_range_hint_shows_variation() -> None:
+def test_duration_range_hint_shows_variation(identity: Callable[[Any], Any]) -> None:
     """Test that generated durations show variation."""
     hint = DurationRangeHint(fmt="S", min=1.0, max=100.0, avg=50.0)
-    call_next = Mock(side_effect=lambda x: x)
 
-    results = [hint.process_value(None, call_next) for _ in range(15)]
+    results = [hint.process_value(None, identity) for _ in range(15)]
 
     # Should have some variation (not all identical)
     unique_values = set(results)
     assert len(unique_values) > 1
 
 
-def test_duration_range_hint_hms_format_processing() -> None:
+def test_duration_range_hint_hms_format_processing(identity_mock: Mock) -> None:
     """Test that HMS format processing works correctly."""
     hint = DurationRangeHint(fmt="HMS", min=3600.0, max=7200.0, avg=5400.0)  # 1-2 hours
-    call_next = Mock(side_effect=lambda x: x)
 
-    result = hint.process_value(None, call_next)
+    result = hint.process_value(None, identity_mock)
 
     # HMS format returns formatted time string
     assert isinstance(result, str)
     # Should match HH:MM:SS format for 1-2 hours
-    parts = result.split(":")
-    assert len(parts) == 3
-    hours, _minutes, _seconds = map(int, parts)
+    match = _HMS_RE.match(result)
+    assert match
+    hours = int(match.group(1))
     assert 1 <= hours <= 2  # Should be 1-2 hours given the range
-    call_next.assert_called_once()
+    identity_mock.assert_called_once()
@@ -1,5 +1,10 @@
 """Tests for array length generation using NumberHint."""
 
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
 from factoreally.hints import NumberHint
 from factoreally.hints.number_hint import (
     BetaDistribution,
@@ -10,18 +15,12 @@ from factoreally.hints.number_hint import (
 )
 
 
-def test_number_hint_uniform_distribution_for_length() -> None:
+def test_number_hint_uniform_distribution_for_length(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with uniform distribution for array length generation."""
     hint = NumberHint(min=2, max=5)
 
-    def mock_call_next(value: int) -> int:
-        return value
-
     # Test multiple generations
-    results = []
-    for _ in range(20):
-        result = hint.process_value(None, mock_call_next)
-        results.append(result)
+    results = [hint.process_value(None, identity) for _ in range(20)]
 
     # All results should be integers in the specified range
     assert all(isinstance(r, int) for r in results)
@@ -32,47 +31,37 @@ def test_number_hint_uniform_distribution_for_length() -> None:
         assert len(set(results)) > 1
 
 
-def test_number_hint_normal_distribution_for_length() -> None:
+def test_number_hint_normal_distribution_for_length(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with normal distribution for array length generation."""
     hint = NumberHint(min=1, max=10, norm=NormalDistribution(mean=5.0, std=2.0))
 
-    def mock_call_next(value: int) -> int:
-        return value
-
     # Test multiple generations
-    results = []
-    for _ in range(50):
-        result = hint.process_value(None, mock_call_next)
-        results.append(result)
+    results = [hint.process_value(None, identity) for _ in range(50)]
 
     # All results should be integers in the specified range
-    assert all(isinstance(r, int) for r in results)
-    assert all(1 <= r <= 10 for r in results)
+    assert {type(r) for r in results} == {int}
+    arr = np.asarray(results)
+    assert arr.min() >= 1
+    assert arr.max() <= 10
 
 
-def test_number_hint_constant_length() -> None:
+def test_number_hint_constant_length(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with constant length (min == max)."""
     hint = NumberHint(min=3, max=3)
 
-    def mock_call_next(value: int) -> int:
-        return value
-
     # Test multiple generations
     for _ in range(10):
-        result = hint.process_value(None, mock_call_next)
+        result = hint.process_value(None, identity)
         assert result == 3
         assert isinstance(result, int)
 
 
-def test_number_hint_passes_existing_value() -> None:
+def test_number_hint_passes_existing_value(identity: Callable[[Any], Any]) -> None:
     """Test that NumberHint passes through existing values unchanged."""
     hint = NumberHint(min=2, max=5)
 
-    def mock_call_next(value: int) -> int:
-        return value
-
     # Should pass through existing value
-    result = hint.process_value(42, mock_call_next)
+    result = hint.process_value(42, identity)
     assert result == 42
 
 
@@ -82,89 +71,73 @@ def test_number_hint_type_is_number() -> None:
     assert hint.type == "NUMBER"
 
 
-def test_number_hint_beta_distribution() -> None:
+def test_number_hint_beta_distribution(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with beta distribution."""
     # Beta distribution with typical parameters, using prec to preserve float type
     hint = NumberHint(min=0.0, max=1.0, prec=2, beta=BetaDistribution(a=2.0, b=5.0, loc=0.0, scale=1.0))
 
-    def mock_call_next(value: float) -> float:
-        return value
-
     # Test multiple generations
-    results = []
-    for _ in range(50):
-        result = hint.process_value(None, mock_call_next)
-        results.append(result)
+    results = [hint.process_value(None, identity) for _ in range(10)]
 
     # All results should be floats in the specified range
-    assert all(isinstance(r, float) for r in results)
-    assert all(0.0 <= r <= 1.0 for r in results)
+    assert {type(r) for r in results} == {float}
+    arr = np.asarray(results)
+    assert arr.min() >= 0.0
+    assert arr.max() <= 1.0
 
     # Should have some variation
-    assert len(set(results)) > 1
+    assert np.unique(arr).size > 1
 
 
-def test_number_hint_lognorm_distribution() -> None:
+def test_number_hint_lognorm_distribution(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with log-normal distribution."""
     # Log-normal distribution with typical parameters, using prec to preserve float type
     hint = NumberHint(min=0.1, max=10.0, prec=2, lognorm=LognormDistribution(s=1.0, loc=0.0, scale=1.0))
 
-    def mock_call_next(value: float) -> float:
-        return value
-
     # Test multiple generations
-    results = []
-    for _ in range(50):
-        result = hint.process_value(None, mock_call_next)
-        results.append(result)
+    results = [hint.process_value(None, identity) for _ in range(10)]
 
     # All results should be floats in the specified range
-    assert all(isinstance(r, float) for r in results)
-    assert all(0.1 <= r <= 10.0 for r in results)
+    assert {type(r) for r in results} == {float}
+    arr = np.asarray(results)
+    assert arr.min() >= 0.1
+    assert arr.max() <= 10.0
 
     # Should have some variation
-    assert len(set(results)) > 1
+    assert np.unique(arr).size > 1
 
 
-def test_number_hint_expon_distribution() -> None:
+def test_number_hint_expon_distribution(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with exponential distribution."""
     # Exponential distribution with typical parameters, using prec to preserve float type
     hint = NumberHint(min=0.0, max=5.0, prec=2, expon=ExponentialDistribution(loc=0.0, scale=1.0))
 
-    def mock_call_next(value: float) -> float:
-        return value
-
     # Test multiple generations
-    results = []
-    for _ in range(50):
-        result = hint.process_value(None, mock_call_next)
-        results.append(result)
+    results = [hint.process_value(None, identity) for _ in range(10)]
 
     # All results should be floats in the specified range
-    assert all(isinstance(r, float) for r in results)
-    assert all(0.0 <= r <= 5.0 for r in results)
+    assert {type(r) for r in results} == {float}
+    arr = np.asarray(results)
+    assert arr.min() >= 0.0
+    assert arr.max() <= 5.0
 
     # Should have some variation
-    assert len(set(results)) > 1
+    assert np.unique(arr).size > 1
 
 
-def test_number_hint_weibull_distribution() -> None:
+def test_number_hint_weibull_distribution(identity: Callable[[Any], Any]) -> None:
     """Test NumberHint with Weibull distribution."""
     # Weibull distribution with typical parameters, using prec to preserve float type
     hint = NumberHint(min=0.1, max=5.0, prec=2, weibull=WeibullDistribution(c=1.5, loc=0.0, scale=1.0))
 
-    def mock_call_next(value: float) -> float:
-        return value
-
     # Test multiple generations
-    results = []
-    for _ in range(50):
-        result = hint.process_value(None, mock_call_next)
-        results.append(result)
+    results = [hint.process_value(None, identity) for _ in range(10)]
 
     # All results should be floats in the specified range
-    assert all(isinstance(r, float) for r in results)
-    assert all(0.1 <= r <= 5.0 for r in results)
+    assert {type(r) for r in results} == {float}
+    arr = np.asarray(results)
+    assert arr.min() >= 0.1
+    assert arr.max() <= 5.0
 
     # Should have some variation
-    assert len(set(results)) > 1
+    assert np.unique(arr).size > 1
@@ -0,0 +1,46 @@
+"""Tests that hints pass existing values through to the rest of the chain."""
+
+from typing import Any
+
+import pytest
+
+from factoreally.hints import (
+    AlphanumericHint,
+    Auth0IdHint,
+    ChoiceHint,
+    ConstantValueHint,
+    DateHint,
+    DurationRangeHint,
+    MacAddressHint,
+    TextHint,
+    VersionHint,
+)
+from factoreally.hints.base import AnalysisHint
+
+
+@pytest.mark.parametrize(
+    ("hint", "existing_value"),
+    [
+        pytest.param(AlphanumericHint(chrs={"AB": [0]}), "existing", id="alphanumeric"),
+        pytest.param(Auth0IdHint(), "existing_id", id="auth0_id"),
+        pytest.param(ChoiceHint(choices=["X", "Y"], weights=[70.0, 30.0]), "existing_choice", id="choice"),
+        pytest.param(ConstantValueHint(val="constant"), "existing", id="constant_value"),
+        pytest.param(DateHint(min="2023-01-01", max="2023-12-31"), "2022-06-15", id="date"),
+        pytest.param(DurationRangeHint(fmt="HMS", min=0.0, max=100.0, avg=50.0), 42, id="duration_range"),
+        pytest.param(MacAddressHint(), "00:11:22:33:44:55", id="mac_address"),
+        pytest.param(TextHint(min=5, max=15), "existing_text", id="text"),
+        pytest.param(VersionHint(pattern_type="Version_Full"), "3.1.4", id="version"),
+    ],
+)
+def test_hint_process_value_with_existing_value_passes_through(hint: AnalysisHint, existing_value: Any) -> None:
+    """Test that process_value passes existing non-None values to call_next unchanged."""
+    calls: list[Any] = []
+
+    def call_next(value: Any) -> str:
+        calls.append(value)
+        return f"processed_{value}"
+
+    result = hint.process_value(existing_value, call_next)
+
+    assert result == f"processed_{existing_value}"
+    assert calls == [existing_value]
@@ -1,23 +1,36 @@
 """Tests for string hint functionality."""
 
 import uuid
+from collections.abc import Callable
+from typing import Any
 
 from factoreally.hints import Uuid4Hint
 
 
-def test_uuid4_hint() -> None:
+def test_uuid4_hint(identity: Callable[[Any], Any]) -> None:
     """Test UUID4 hint."""
     hint = Uuid4Hint()
 
     # Test processing with no input value (generates new UUID)
-    def mock_call_next(value: str | None) -> str | None:
-        return value
-
-    generated_value = hint.process_value(None, mock_call_next)
+    generated_value = hint.process_value(None, identity)
     assert isinstance(generated_value, str)
     uuid.UUID(generated_value)  # Should not raise
 
     # Test processing with existing value (passes through)
     existing_value = "existing-value"
-    result_value = hint.process_value(existing_value, mock_call_next)
+    result_value = hint.process_value(existing_value, identity)
     assert result_value == existing_value
+
+
+def test_uuid4_hint_generates_unique_version_4_uuids(identity: Callable[[Any], Any]) -> None:
+    """Test that generated values are distinct, canonical version 4 UUIDs."""
+    hint = Uuid4Hint()
+
+    values = [hint.process_value(None, identity) for _ in range(1000)]
+
+    assert len(set(values)) == 1000
+    for value in values:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
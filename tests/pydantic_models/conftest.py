@@ -4,41 +4,71 @@ from collections.abc import Mapping
 from datetime import date
 from typing import Any
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, ConfigDict, RootModel
+
+# Explicitly export the shared test models
+__all__ = [
+    "ConfigModel",
+    "DailyCounts",
+    "DeepNestedModel",
+    "Level1Model",
+    "Level2Model",
+    "MappingModel",
+    "NestedModel",
+    "NoMetadataModel",
+    "SimpleModel",
+]
+
+# These models are only introspected, never used for validation, so each one defers
+# building its pydantic-core schema and leaves forward references for the analyzer to resolve.
 
 
 class SimpleModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     age: int
     metadata: dict[str, Any]  # Dynamic field
 
 
 class NestedModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     user_data: dict[str, str]  # Dynamic field
     settings: "ConfigModel"
 
 
 class ConfigModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     theme: str
     preferences: dict[str, int]  # Dynamic field
 
 
 class NoMetadataModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     age: int
     tags: list[str]  # Not a dynamic dict
 
 
 class DeepNestedModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     level1: "Level1Model"
 
 
 class Level1Model(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     level2: "Level2Model"
     metadata: dict[str, str]  # Dynamic field at level 1
 
 
 class Level2Model(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     config: dict[str, Any]  # Dynamic field at level 2
 
@@ -47,11 +77,15 @@ class Level2Model(BaseModel):
 class DailyCounts(RootModel[Mapping[date, int]]):
     """Dictionary with date strings as keys and counts as values"""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: Mapping[date, int]
 
 
 class MappingModel(BaseModel):
     """Model with a RootModel field using Mapping type."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     daily_stats: DailyCounts  # Dynamic field using RootModel with Mapping
@@ -1,5 +1,7 @@
 """Tests for analyze_pydantic_model function."""
 
+from pydantic import BaseModel
+
 from factoreally.pydantic_models import analyze_pydantic_model
 
 from .conftest import (
@@ -71,3 +73,31 @@ def test_analyze_pydantic_model_with_mapping_field() -> None:
     assert "daily_stats.root" in dynamic_fields
     assert "name" not in dynamic_fields
     assert len(dynamic_fields) == 2
+
+
+def test_analyze_pydantic_model_returns_independent_sets() -> None:
+    """Test that repeated analysis of a model returns equal sets that can be modified independently."""
+    first = analyze_pydantic_model(NestedModel)
+    first.add("extra")
+
+    second = analyze_pydantic_model(NestedModel)
+
+    assert second == {"user_data", "settings.preferences"}
+
+
+def test_analyze_pydantic_model_after_model_rebuild() -> None:
+    """Test that a model analyzed before model_rebuild resolves its forward references is analyzed again."""
+
+    class Outer(BaseModel):
+        name: str
+        inner: "Later"
+
+    # The forward reference can't be resolved yet
+    assert analyze_pydantic_model(Outer) == set()
+
+    class Later(BaseModel):
+        data: dict[str, int]
+
+    Outer.model_rebuild(_types_namespace={"Later": Later})
+
+    assert analyze_pydantic_model(Outer) == {"inner.data"}
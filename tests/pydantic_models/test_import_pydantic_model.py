@@ -1,5 +1,7 @@
 """Tests for import_pydantic_model function."""
 
+import re
+
 import click
 import pytest
 
@@ -7,6 +9,12 @@ from factoreally.pydantic_models import import_pydantic_model
 
 from .conftest import SimpleModel
 
+# Expected error messages, compiled once rather than by each pytest.raises
+_INVALID_PATH = re.compile("Invalid import path")
+_MODULE_NOT_FOUND = re.compile("Cannot import module")
+_CLASS_NOT_FOUND = re.compile(r"Class .* not found")
+_NOT_BASEMODEL = re.compile("not a Pydantic BaseModel")
+
 
 def test_import_pydantic_model_valid() -> None:
     """Test importing a valid Pydantic model."""
@@ -18,26 +26,17 @@ def test_import_pydantic_model_valid() -> None:
     assert issubclass(imported_model, SimpleModel)
 
 
-def test_import_pydantic_model_invalid_path() -> None:
-    """Test importing with invalid import path format."""
-    with pytest.raises(click.ClickException, match="Invalid import path"):
-        import_pydantic_model("InvalidPath")
-
-
-def test_import_pydantic_model_module_not_found() -> None:
-    """Test importing from non-existent module."""
-    with pytest.raises(click.ClickException, match="Cannot import module"):
-        import_pydantic_model("nonexistent.module.Model")
-
-
-def test_import_pydantic_model_class_not_found() -> None:
-    """Test importing non-existent class from valid module."""
-    with pytest.raises(click.ClickException, match=r"Class .* not found"):
-        import_pydantic_model("tests.pydantic_models.conftest.NonExistentModel")
-
-
-def test_import_pydantic_model_not_basemodel() -> None:
-    """Test importing class that is not a BaseModel."""
-    with pytest.raises(click.ClickException, match="not a Pydantic BaseModel"):
-        # Try to import a non-BaseModel class - use str as example
-        import_pydantic_model("builtins.str")
+@pytest.mark.parametrize(
+    ("import_path", "match"),
+    [
+        pytest.param("InvalidPath", _INVALID_PATH, id="invalid_path"),
+        pytest.param("nonexistent.module.Model", _MODULE_NOT_FOUND, id="module_not_found"),
+        pytest.param("tests.pydantic_models.conftest.NonExistentModel", _CLASS_NOT_FOUND, id="class_not_found"),
+        # A non-BaseModel class - use str as example
+        pytest.param("builtins.str", _NOT_BASEMODEL, id="not_basemodel"),
+    ],
+)
+def test_import_pydantic_model_errors(import_path: str, match: re.Pattern[str]) -> None:
+    """Test that invalid paths, missing modules or classes, and non-BaseModel classes raise ClickException."""
+    with pytest.raises(click.ClickException, match=match):
+        import_pydantic_model(import_path)
@@ -2,34 +2,22 @@
 
 from typing import Any
 
-from factoreally.pydantic_models import _is_dynamic_dict_field
-
-
-def test_is_dynamic_dict_field_dict_str_any() -> None:
-    """Test _is_dynamic_dict_field with Dict[str, Any]."""
-    assert _is_dynamic_dict_field(dict[str, Any]) is True
-
-
-def test_is_dynamic_dict_field_dict_str_str() -> None:
-    """Test _is_dynamic_dict_field with Dict[str, str]."""
-    assert _is_dynamic_dict_field(dict[str, str]) is True
-
+import pytest
 
-def test_is_dynamic_dict_field_dict_int_str() -> None:
-    """Test _is_dynamic_dict_field with Dict[int, str] (dynamic)."""
-    assert _is_dynamic_dict_field(dict[int, str]) is True
-
-
-def test_is_dynamic_dict_field_list() -> None:
-    """Test _is_dynamic_dict_field with list type (not dynamic)."""
-    assert _is_dynamic_dict_field(list[str]) is False
-
-
-def test_is_dynamic_dict_field_str() -> None:
-    """Test _is_dynamic_dict_field with simple str type (not dynamic)."""
-    assert _is_dynamic_dict_field(str) is False
+from factoreally.pydantic_models import _is_dynamic_dict_field
 
 
-def test_is_dynamic_dict_field_none() -> None:
-    """Test _is_dynamic_dict_field with None (not dynamic)."""
-    assert _is_dynamic_dict_field(None) is False
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        pytest.param(dict[str, Any], True, id="dict_str_any"),
+        pytest.param(dict[str, str], True, id="dict_str_str"),
+        pytest.param(dict[int, str], True, id="dict_int_str"),
+        pytest.param(list[str], False, id="list"),
+        pytest.param(str, False, id="str"),
+        pytest.param(None, False, id="none"),
+    ],
+)
+def test_is_dynamic_dict_field(annotation: Any, *, expected: bool) -> None:
+    """Test _is_dynamic_dict_field with dict types (dynamic) and other types (not dynamic)."""
+    assert _is_dynamic_dict_field(annotation) is expected